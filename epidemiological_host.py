@@ -261,19 +261,20 @@ class ContactResponse(object):
         self.next_event_time = float('inf')
 
 
-def build_host(condition, i):
+def build_host(condition, i, rng=random):
     """
     EpiHost factory
     :param condition: unexposed, infected, recovered epidemiological state
     :param i: iterator
+    :param rng: source of randomness, e.g. a seeded random.Random instance
     :return: new EpiHost instance
     """
     state = {
         'condition': condition,
-        'x': random.randint(HostConfig.SIZE + 12, Screen.WIDTH - HostConfig.SIZE - 12),
-        'y': random.randint(HostConfig.SIZE + 12, Screen.HEIGHT - 100 - HostConfig.SIZE - 12),
-        'speed': random.randint(HostConfig.MIN_SPEED, HostConfig.MAX_SPEED),
-        'angle': random.randint(0, 359),
+        'x': rng.randint(HostConfig.SIZE + 12, Screen.WIDTH - HostConfig.SIZE - 12),
+        'y': rng.randint(HostConfig.SIZE + 12, Screen.HEIGHT - 100 - HostConfig.SIZE - 12),
+        'speed': rng.randint(HostConfig.MIN_SPEED, HostConfig.MAX_SPEED),
+        'angle': rng.randint(0, 359),
         'r': HostConfig.SIZE / 2.,
         'name': str(i),
         'color': Disease.COLOR_MAP[condition],
@@ -282,13 +283,14 @@ def build_host(condition, i):
     return EpiHost(state)
 
 
-def make_hosts(unexposed: int, infected: int) -> list:
+def make_hosts(unexposed: int, infected: int, rng=random) -> list:
     """
     Makes a number of unexposed and infected hosts
     :param unexposed: int number of unexposed EpiHosts
     :param infected: int number of infected EpiHosts
+    :param rng: source of randomness, e.g. a seeded random.Random instance
     :return: list EpiHost instances
     """
-    unexposed = [build_host(Disease.UNEXPOSED, i) for i in range(unexposed)]
-    infected = [build_host(Disease.INFECTED, i) for i in range(infected)]
+    unexposed = [build_host(Disease.UNEXPOSED, i, rng) for i in range(unexposed)]
+    infected = [build_host(Disease.INFECTED, i, rng) for i in range(infected)]
     return unexposed + infected
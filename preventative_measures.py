@@ -9,11 +9,12 @@ class PreventativeMeasures:
     Represents a set of strategies for minimizing scope of infection
     """
 
-    def __init__(self, hosts, measures, vaccination_rate, percent):
+    def __init__(self, hosts, measures, vaccination_rate, percent, rng=random):
         self.hosts = hosts
         self.measures = measures
         self.vaccination_rate = vaccination_rate
         self.percent = percent
+        self.rng = rng
 
     def enact(self):
         for measure in self.measures:
@@ -25,7 +26,7 @@ class PreventativeMeasures:
                 self.vaccinate_population()
 
     def get_random_sample(self):
-        return random.sample(
+        return self.rng.sample(
             self.hosts,
             math.ceil(len(self.hosts) * self.percent)
         )
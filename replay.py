@@ -0,0 +1,288 @@
+"""
+Deterministic replay and golden-trajectory regression harness.
+
+A reference scenario fixes a population, a set of preventative measures, and a list of
+seeds. Running it headlessly records, for every seed, the per-tick unexposed/infected/recovered
+curve and the host positions at a few early checkpoint ticks. The recording is saved as a
+golden trajectory that any other engine must reproduce within the stated tolerances.
+
+Host collisions are chaotic: a difference in the last bit of a float eventually changes
+which hosts meet, so individual runs of two correct engines drift apart after a couple of
+hundred ticks. Positions are therefore only compared at early checkpoints, and the epidemic
+itself is compared through the ensemble over all seeds of a scenario.
+
+Record golden trajectories:   python replay.py record
+Verify against them:          python replay.py verify
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+from constants import Disease, InitialCondition, PreventativeMeasure, Screen
+from universe import Universe
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+
+
+class Tolerance:
+    """
+    Maximum allowed deviation from a golden trajectory.
+    Defaults leave roughly 1.5x headroom over the drift of a reference engine whose
+    starting positions are perturbed by 1e-9px.
+    """
+
+    def __init__(self, count=6, peak_infected=4, time_to_peak=50, total_infected=4, position=0.01):
+        """
+        :param count: hosts, per condition, per tick, on the mean curve over all seeds
+        :param peak_infected: hosts, on the mean over all seeds of each run's peak infected count
+        :param time_to_peak: ticks, on the peak of the mean infected curve
+        :param total_infected: hosts, on the mean over all seeds of infected + recovered at the last tick
+        :param position: pixels, per host, per seed, per checkpoint
+        """
+        self.count = count
+        self.peak_infected = peak_infected
+        self.time_to_peak = time_to_peak
+        self.total_infected = total_infected
+        self.position = position
+
+
+class Scenario:
+    """
+    Reference scenario replayed by the harness.
+    Checkpoints must lie well before runs start to diverge (around tick 130).
+    """
+
+    def __init__(self, name, seeds, measures, ticks=500, checkpoints=(0, 25),
+                 unexposed=InitialCondition.POP_UNEXPOSED, infected=InitialCondition.POP_INFECTED):
+        self.name = name
+        self.seeds = seeds
+        self.measures = measures
+        self.ticks = ticks
+        self.checkpoints = checkpoints
+        self.unexposed = unexposed
+        self.infected = infected
+
+
+SCENARIOS = [
+    Scenario('no_measures', seeds=(1, 2, 3, 4), measures=[]),
+    Scenario('shelter', seeds=(1, 2, 3, 4), measures=[PreventativeMeasure.SHELTER_IN_PLACE]),
+    Scenario('limit_travel', seeds=(1, 2, 3, 4), measures=[PreventativeMeasure.LIMIT_TRAVEL]),
+    Scenario('shelter_vaccine', seeds=(1, 2, 3, 4), unexposed=45, infected=5, measures=[
+        PreventativeMeasure.VACCINATE_POP,
+        PreventativeMeasure.SHELTER_IN_PLACE
+    ]),
+]
+
+
+def build_universe(scenario, seed):
+    """
+    Reference engine: a headless, seeded Universe
+    :param scenario: Scenario to build
+    :param seed: seed for this run
+    :return: Universe instance with preventative measures enacted
+    """
+    universe = Universe(
+        seed=seed,
+        headless=True,
+        unexposed=scenario.unexposed,
+        infected=scenario.infected
+    )
+    universe.enact_preventative_measures(scenario.measures)
+    return universe
+
+
+def record_run(scenario, seed, engine=build_universe):
+    """
+    Steps an engine through one seed of a scenario and records its trajectory.
+    An engine is any callable taking a Scenario and a seed and returning an object that
+    exposes `hosts`, `calculate_state()`, `progress_healing()` and `get_population_count()`
+    with the same semantics as Universe.
+    :param scenario: Scenario to replay
+    :param seed: seed for this run
+    :param engine: engine factory
+    :return: dict run trajectory
+    """
+    universe = engine(scenario, seed)
+    curve = []
+    checkpoints = []
+
+    for tick in range(scenario.ticks + 1):
+        if tick in scenario.checkpoints:
+            checkpoints.append({
+                'tick': tick,
+                'positions': [[host.x, host.y] for host in universe.hosts],
+            })
+
+        curve.append([
+            universe.get_population_count(Disease.UNEXPOSED),
+            universe.get_population_count(Disease.INFECTED),
+            universe.get_population_count(Disease.RECOVERED),
+        ])
+
+        if tick < scenario.ticks:
+            universe.calculate_state()
+            universe.iteration += Screen.GRAPH_X_UNIT
+            universe.progress_healing()
+
+    return {
+        'seed': seed,
+        'curve': curve,
+        'checkpoints': checkpoints,
+    }
+
+
+def record_trajectory(scenario, engine=build_universe):
+    """
+    Records every seed of a scenario
+    :param scenario: Scenario to replay
+    :param engine: engine factory, see `record_run`
+    :return: dict trajectory
+    """
+    return {
+        'scenario': scenario.name,
+        'runs': [record_run(scenario, seed, engine) for seed in scenario.seeds],
+    }
+
+
+def summarize(trajectory):
+    """
+    Reduces the runs of a trajectory to ensemble statistics
+    :param trajectory: trajectory as returned by `record_trajectory`
+    :return: dict with the mean S/I/R curve and the epidemic aggregates
+    """
+    curves = [run['curve'] for run in trajectory['runs']]
+    runs = len(curves)
+
+    mean_curve = [
+        [sum(curve[tick][condition] for curve in curves) / runs for condition in range(3)]
+        for tick in range(min(len(curve) for curve in curves))
+    ]
+    infected = [counts[1] for counts in mean_curve]
+
+    return {
+        'mean_curve': mean_curve,
+        'peak_infected': sum(max(counts[1] for counts in curve) for curve in curves) / runs,
+        'time_to_peak': infected.index(max(infected)),
+        'total_infected': sum(curve[-1][1] + curve[-1][2] for curve in curves) / runs,
+    }
+
+
+def compare_trajectories(expected, actual, tolerance=None):
+    """
+    Compares a trajectory against a golden one
+    :param expected: golden trajectory
+    :param actual: trajectory under test
+    :param tolerance: Tolerance instance, defaults to Tolerance()
+    :return: list of str mismatch descriptions, empty if within tolerance
+    """
+    tolerance = tolerance or Tolerance()
+    mismatches = []
+
+    expected_seeds = [run['seed'] for run in expected['runs']]
+    actual_seeds = [run['seed'] for run in actual['runs']]
+    if expected_seeds != actual_seeds:
+        return [f"seeds {actual_seeds} != {expected_seeds}"]
+
+    for want_run, got_run in zip(expected['runs'], actual['runs']):
+        if len(want_run['curve']) != len(got_run['curve']):
+            mismatches.append(f"seed {want_run['seed']}: curve length {len(got_run['curve'])} "
+                              f"!= {len(want_run['curve'])}")
+
+        got_checkpoints = {c['tick']: c['positions'] for c in got_run['checkpoints']}
+        for checkpoint in want_run['checkpoints']:
+            tick, want = checkpoint['tick'], checkpoint['positions']
+            got = got_checkpoints.get(tick)
+            if got is None or len(got) != len(want):
+                mismatches.append(f"seed {want_run['seed']}: checkpoint {tick} missing or wrong host count")
+                continue
+            for i, (w, g) in enumerate(zip(want, got)):
+                distance = math.hypot(w[0] - g[0], w[1] - g[1])
+                if distance > tolerance.position:
+                    mismatches.append(f"seed {want_run['seed']}: checkpoint {tick}: "
+                                      f"host {i} off by {distance:.6g}px")
+
+    want, got = summarize(expected), summarize(actual)
+
+    for tick, (want_counts, got_counts) in enumerate(zip(want['mean_curve'], got['mean_curve'])):
+        if any(abs(w - g) > tolerance.count for w, g in zip(want_counts, got_counts)):
+            mismatches.append(f"tick {tick}: mean S/I/R {[round(g, 2) for g in got_counts]} "
+                              f"!= {[round(w, 2) for w in want_counts]}")
+
+    for aggregate in ('peak_infected', 'time_to_peak', 'total_infected'):
+        if abs(want[aggregate] - got[aggregate]) > getattr(tolerance, aggregate):
+            mismatches.append(f"{aggregate}: {got[aggregate]:.2f} != {want[aggregate]:.2f}")
+
+    return mismatches
+
+
+def golden_path(scenario):
+    return os.path.join(GOLDEN_DIR, f"{scenario.name}.json")
+
+
+def save_golden(scenario, trajectory):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(golden_path(scenario), 'w') as f:
+        json.dump(trajectory, f)
+
+
+def load_golden(scenario):
+    with open(golden_path(scenario)) as f:
+        return json.load(f)
+
+
+def verify(engine=build_universe, scenarios=SCENARIOS, tolerance=None):
+    """
+    Verifies an engine against the golden trajectories of the given scenarios
+    :return: dict of scenario name to list of mismatches
+    """
+    return {
+        scenario.name: compare_trajectories(
+            load_golden(scenario),
+            record_trajectory(scenario, engine),
+            tolerance
+        )
+        for scenario in scenarios
+    }
+
+
+def main(argv=None):
+    defaults = Tolerance()
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('command', choices=['record', 'verify'])
+    parser.add_argument('--scenario', action='append', help="scenario name (default: all)")
+    parser.add_argument('--count-tolerance', type=float, default=defaults.count)
+    parser.add_argument('--peak-infected-tolerance', type=float, default=defaults.peak_infected)
+    parser.add_argument('--time-to-peak-tolerance', type=int, default=defaults.time_to_peak)
+    parser.add_argument('--total-infected-tolerance', type=float, default=defaults.total_infected)
+    parser.add_argument('--position-tolerance', type=float, default=defaults.position)
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+
+    if args.command == 'record':
+        for scenario in scenarios:
+            save_golden(scenario, record_trajectory(scenario))
+            print(f"recorded {golden_path(scenario)}")
+        return 0
+
+    tolerance = Tolerance(
+        count=args.count_tolerance,
+        peak_infected=args.peak_infected_tolerance,
+        time_to_peak=args.time_to_peak_tolerance,
+        total_infected=args.total_infected_tolerance,
+        position=args.position_tolerance
+    )
+    failed = False
+    for name, mismatches in verify(scenarios=scenarios, tolerance=tolerance).items():
+        print(f"{name}: {'ok' if not mismatches else f'{len(mismatches)} mismatches'}")
+        for mismatch in mismatches[:10]:
+            print(f"    {mismatch}")
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
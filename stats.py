@@ -1,7 +1,7 @@
 import pygame
 from pygame.rect import Rect
 
-from constants import InitialCondition, Screen, Disease, SimColor
+from constants import Screen, Disease, SimColor
 
 
 class EpidemicStats:
@@ -13,9 +13,10 @@ class EpidemicStats:
         self.universe = universe
 
         # Initialize counts
-        self.max_active_infected_percent = round((InitialCondition.POP_INFECTED / len(self.universe.hosts)), 2) * 100
+        initial_infected = self.universe.get_population_count(Disease.INFECTED)
+        self.max_active_infected_percent = round((initial_infected / len(self.universe.hosts)), 2) * 100
         self.max_total_infected_percent = self.max_active_infected_percent
-        self.max_infected = InitialCondition.POP_INFECTED
+        self.max_infected = initial_infected
         self.medical_limit = Screen.MEDICAL_LIMIT
 
     def update(self):
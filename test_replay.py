@@ -0,0 +1,61 @@
+import copy
+import unittest
+
+import replay
+from constants import PreventativeMeasure
+
+
+SHORT = replay.Scenario('short', seeds=(1, 2), ticks=60, measures=[PreventativeMeasure.LIMIT_TRAVEL])
+
+
+def perturbed_universe(scenario, seed):
+    """
+    Reference engine with every host nudged by 1e-9px, standing in for an engine
+    that evaluates the same physics in a different floating point order
+    """
+    universe = replay.build_universe(scenario, seed)
+    for host in universe.hosts:
+        host.x += 1e-9
+    return universe
+
+
+class TestReplay(unittest.TestCase):
+
+    def test_same_seed_replays_identically(self):
+        self.assertEqual(replay.record_trajectory(SHORT), replay.record_trajectory(SHORT))
+
+    def test_different_seeds_differ(self):
+        first, second = replay.record_trajectory(SHORT)['runs']
+        self.assertNotEqual(first['checkpoints'], second['checkpoints'])
+
+    def test_identical_trajectories_match(self):
+        trajectory = replay.record_trajectory(SHORT)
+        self.assertEqual(replay.compare_trajectories(trajectory, copy.deepcopy(trajectory)), [])
+
+    def test_shifted_curve_is_reported(self):
+        expected = replay.record_trajectory(SHORT)
+        actual = copy.deepcopy(expected)
+        for run in actual['runs']:
+            for counts in run['curve'][30:]:
+                counts[0] -= 10
+                counts[1] += 10
+
+        mismatches = replay.compare_trajectories(expected, actual)
+        self.assertTrue(any(m.startswith('tick 30:') for m in mismatches))
+        self.assertTrue(any(m.startswith('peak_infected') for m in mismatches))
+
+    def test_moved_host_is_reported(self):
+        expected = replay.record_trajectory(SHORT)
+        actual = copy.deepcopy(expected)
+        actual['runs'][0]['checkpoints'][1]['positions'][3][0] += 1
+
+        mismatches = replay.compare_trajectories(expected, actual)
+        self.assertEqual(mismatches, ["seed 1: checkpoint 25: host 3 off by 1px"])
+
+    def test_perturbed_engine_within_default_tolerance(self):
+        for name, mismatches in replay.verify(engine=perturbed_universe).items():
+            self.assertEqual(mismatches, [], name)
+
+
+if __name__ == '__main__':
+    unittest.main()
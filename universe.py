@@ -32,21 +32,34 @@ class Universe(object):
     Represents a 2-dimensional space and time containing a population of epidemiological hosts
     """
 
-    def __init__(self):
-        pygame.init()
+    def __init__(self, seed=None, headless=False, unexposed=InitialCondition.POP_UNEXPOSED,
+                 infected=InitialCondition.POP_INFECTED):
+        """
+        :param seed: seed for the Universe's random source; None draws fresh entropy each run
+        :param headless: if True, skips pygame display setup so state can be stepped without a screen
+        :param unexposed: int number of unexposed EpiHosts
+        :param infected: int number of infected EpiHosts
+        """
+        self.rng = random.Random(seed)
+        self.screen = None
 
-        self.screen = pygame.display.set_mode(
-            size=(Screen.WIDTH, Screen.HEIGHT),
-            flags=0,
-            depth=32,
-        )
+        if not headless:
+            pygame.init()
+
+            self.screen = pygame.display.set_mode(
+                size=(Screen.WIDTH, Screen.HEIGHT),
+                flags=0,
+                depth=32,
+            )
 
         self.hosts = make_hosts(
-            unexposed=InitialCondition.POP_UNEXPOSED,
-            infected=InitialCondition.POP_INFECTED
+            unexposed=unexposed,
+            infected=infected,
+            rng=self.rng
         )
 
-        self.screen.fill(SimColor.DARK_GREY)
+        if self.screen:
+            self.screen.fill(SimColor.DARK_GREY)
         self.border = build_border()
         self.clock = pygame.time.Clock()
         self.iteration = 0
@@ -119,18 +132,7 @@ class Universe(object):
         """
         Runs the simulation
         """
-        i = 0
-
-        actions = PreventativeMeasure.SELECTED
-
-        self.preventative_measures = PreventativeMeasures(
-            self.hosts,
-            actions,
-            HostConfig.VACCINATION_DRIP,
-            HostConfig.PREVENTATIVE_MEASURE_ADHERENCE
-        )
-
-        self.preventative_measures.enact()
+        self.enact_preventative_measures(PreventativeMeasure.SELECTED)
 
         while not self.is_epidemic_over:
             self.calculate_state()
@@ -147,6 +149,21 @@ class Universe(object):
         while self.is_epidemic_over:
             pygame.display.update()
 
+    def enact_preventative_measures(self, measures):
+        """
+        Applies the given preventative measures to a sample of the population
+        :param measures: list of PreventativeMeasure constants
+        """
+        self.preventative_measures = PreventativeMeasures(
+            self.hosts,
+            measures,
+            HostConfig.VACCINATION_DRIP,
+            HostConfig.PREVENTATIVE_MEASURE_ADHERENCE,
+            rng=self.rng
+        )
+
+        self.preventative_measures.enact()
+
     def progress_healing(self):
         """
         Decrements time units until fully recovered for all infected hosts,
@@ -154,7 +171,7 @@ class Universe(object):
         """
         for host in self.hosts:
             if host.vaccine:
-                boost_recovery = 1 + random.randint(0, host.vaccine.drip_rate)
+                boost_recovery = 1 + self.rng.randint(0, host.vaccine.drip_rate)
                 host.remaining_recovery -= boost_recovery
 
             if host.remaining_recovery <= 0:
@@ -192,9 +209,9 @@ class Universe(object):
         Returns true if there are no infected hosts
         :return: Boolean
         """
-        return self.get_population_count(Disease.INFECTED) is 0
+        return self.get_population_count(Disease.INFECTED) == 0
 
 
 if __name__ == "__main__":
-    bw = Universe()
+    bw = Universe(seed=int(sys.argv[1]) if len(sys.argv) > 1 else None)
     bw.run()